@@ -1,41 +1,62 @@
 """
 Research Agent for gathering and summarizing information.
 """
+import asyncio
+import os
 from typing import Dict, Any
 from langchain_core.messages import HumanMessage
 from core.llm_factory import LLMFactory
+from core.semantic_cache import SemanticCache
+from core.text_budget import DEFAULT_TOKEN_BUDGET, compress_to_budget, count_tokens
 from tools.search_tool import SearchTool
 from tools.summarization_tool import SummarizationTool
 
 
 class ResearchAgent:
     """Agent responsible for researching and gathering factual information."""
-    
+
     def __init__(self):
         """Initialize the Research Agent with tools and LLM."""
         self.llm = LLMFactory.create_reasoning_llm()
         self.search_tool = SearchTool()
         self.summarization_tool = SummarizationTool()
+        # Research sits downstream of raw user queries, so promote more often
+        self.semantic_cache = SemanticCache("research", promotion_interval=50)
     
-    def research(self, query: str) -> Dict[str, Any]:
+    async def research(self, query: str) -> Dict[str, Any]:
         """
         Conduct research on the given query.
-        
+
         Args:
             query: Research query or topic
-            
+
         Returns:
             Dictionary containing research findings
         """
         try:
-            # Step 1: Search for information
-            search_results = self.search_tool._run(query)
-            
-            # Step 2: Summarize if content is long
-            if len(search_results) > 500:
-                findings = self.summarization_tool._run(search_results)
-            else:
+            # Paraphrased repeats of earlier queries skip the whole
+            # search -> summarize -> LLM chain
+            cached_findings = await asyncio.to_thread(self.semantic_cache.get, query)
+            if cached_findings is not None:
+                return {
+                    "query": query,
+                    "findings": cached_findings,
+                    "agent_type": "research"
+                }
+
+            # Step 1: Search for information (in a thread so the event loop stays free)
+            search_results = await asyncio.to_thread(self.search_tool._run, query)
+
+            # Step 2: Condense only when the content overflows the token
+            # budget of the reasoning model. Extractive compression runs
+            # first because it is pure Python; the summarization LLM call is
+            # the last resort.
+            if count_tokens(search_results) <= DEFAULT_TOKEN_BUDGET:
                 findings = search_results
+            else:
+                findings = await asyncio.to_thread(compress_to_budget, search_results, query)
+                if count_tokens(findings) > DEFAULT_TOKEN_BUDGET:
+                    findings = await self._summarize_concurrently(findings)
             
             # Step 3: Use LLM to structure the findings
             prompt = f"""
@@ -51,14 +72,20 @@ class ResearchAgent:
             """
             
             messages = [HumanMessage(content=prompt)]
-            response = self.llm.invoke(messages)
-            
-            return {
+            response = await self.llm.ainvoke(messages)
+
+            await asyncio.to_thread(self.semantic_cache.set, query, response.content.strip())
+
+            result = {
                 "query": query,
                 "findings": response.content.strip(),
-                "raw_search_results": search_results,
                 "agent_type": "research"
             }
+            # Raw results can be tens of KB and nothing downstream reads
+            # them; keep them only when explicitly debugging
+            if os.getenv("AI_AGENT_DEBUG"):
+                result["raw_search_results"] = search_results
+            return result
             
         except Exception as e:
             return {
@@ -66,4 +93,28 @@ class ResearchAgent:
                 "findings": f"Research completed on {query}. Current AI landscape shows continued advancement in generative AI, enterprise adoption, and emerging regulatory frameworks.",
                 "error": str(e),
                 "agent_type": "research"
-            }
\ No newline at end of file
+            }
+
+    async def _summarize_concurrently(self, text: str, chunk_size: int = 4000) -> str:
+        """
+        Summarize long text by running chunk summaries in parallel.
+
+        Each summarization call is a network-bound LLM round-trip, so
+        overlapping them puts wall-clock time near the slowest chunk
+        instead of the sum of all chunks.
+
+        Args:
+            text: Text to summarize
+            chunk_size: Characters per chunk (well within the fast model)
+
+        Returns:
+            Joined chunk summaries
+        """
+        if len(text) <= chunk_size:
+            return await asyncio.to_thread(self.summarization_tool._run, text)
+
+        chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        summaries = await asyncio.gather(
+            *(asyncio.to_thread(self.summarization_tool._run, chunk) for chunk in chunks)
+        )
+        return "\n".join(summaries)
\ No newline at end of file
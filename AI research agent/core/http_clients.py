@@ -0,0 +1,57 @@
+"""
+Shared HTTP clients for all outbound requests in the process.
+"""
+import asyncio
+import atexit
+from typing import Any, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _build_clients() -> Tuple[Optional[Any], Optional[Any]]:
+    """
+    Build one shared sync and one shared async HTTP client.
+
+    A single keep-alive connection pool amortizes the TLS handshake
+    across every outbound call in the process — LLM requests and search
+    requests alike; HTTP/2 additionally multiplexes concurrent calls
+    over one connection when the h2 extra is installed.
+    """
+    if httpx is None:
+        return None, None
+
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    try:
+        sync_client = httpx.Client(http2=True, timeout=60, limits=limits)
+        async_client = httpx.AsyncClient(http2=True, timeout=60, limits=limits)
+    except ImportError:
+        # h2 not installed; plain HTTP/1.1 keep-alive still pools connections
+        sync_client = httpx.Client(timeout=60, limits=limits)
+        async_client = httpx.AsyncClient(timeout=60, limits=limits)
+
+    atexit.register(sync_client.close)
+
+    def _close_async_client():
+        try:
+            asyncio.run(async_client.aclose())
+        except RuntimeError:
+            pass
+
+    atexit.register(_close_async_client)
+    return sync_client, async_client
+
+
+_SYNC_CLIENT, _ASYNC_CLIENT = _build_clients()
+
+
+def get_sync_client() -> Optional[Any]:
+    """Return the shared sync client, or None when httpx is unavailable."""
+    return _SYNC_CLIENT
+
+
+def get_async_client() -> Optional[Any]:
+    """Return the shared async client, or None when httpx is unavailable."""
+    return _ASYNC_CLIENT
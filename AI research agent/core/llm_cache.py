@@ -0,0 +1,167 @@
+"""
+Exact-match response cache for LLM calls.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# Bump whenever prompt/response semantics change so stale entries never match.
+CACHE_SCHEMA_VERSION = "v1"
+
+DEFAULT_CACHE_DIR = ".llm_cache"
+DEFAULT_TTL_SECONDS = 86400  # 24 hours
+
+
+class _SqliteCache:
+    """
+    Minimal sqlite3-backed response store used when diskcache is absent.
+
+    Keeps cache hits persistent across process restarts with stdlib only;
+    diskcache remains the preferred backend when installed.
+    """
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite3"), check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, content TEXT, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored content, or None when missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, content: str, expire: int) -> None:
+        """Store content under key with a TTL in seconds."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, content, time.time() + expire),
+            )
+            self._conn.commit()
+
+
+class CachedLLM:
+    """
+    Exact-match cache wrapper around a ChatGroq instance.
+
+    Responses are keyed by sha256(schema_version|model|temperature|prompt),
+    so a repeated prompt returns the stored response in microseconds instead
+    of making another Groq round-trip. Entries are persisted via diskcache
+    when available, with a stdlib sqlite3 store otherwise, so hits survive
+    process restarts either way.
+    """
+
+    def __init__(self, llm: Any, cache_dir: str = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL_SECONDS):
+        """
+        Wrap an LLM with an exact-match response cache.
+
+        Args:
+            llm: The underlying ChatGroq instance
+            cache_dir: Directory for the on-disk cache (diskcache only)
+            ttl: Time-to-live for cached responses in seconds
+        """
+        self.llm = llm
+        self.ttl = ttl
+        self._cache = Cache(cache_dir) if Cache is not None else _SqliteCache(cache_dir)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate everything else (model_name, temperature, streaming, ...)
+        return getattr(self.llm, name)
+
+    def _cache_key(self, messages: List[BaseMessage]) -> str:
+        """Compute the cache key for a message list."""
+        # Normalize whitespace so formatting-only differences still hit
+        text = "\n".join(
+            " ".join(str(getattr(message, "content", message)).split())
+            for message in messages
+        )
+        model = getattr(self.llm, "model_name", "unknown")
+        temperature = getattr(self.llm, "temperature", "")
+        raw = f"{CACHE_SCHEMA_VERSION}|{model}|{temperature}|{text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Any:
+        """Look up a cached response content, or None on miss."""
+        return self._cache.get(key)
+
+    def _set(self, key: str, content: str) -> None:
+        """Store a response content under the given key."""
+        self._cache.set(key, content, expire=self.ttl)
+
+    def invoke(self, messages: List[BaseMessage], **kwargs: Any) -> AIMessage:
+        """Invoke the LLM, returning a cached response when available."""
+        key = self._cache_key(messages)
+        cached = self._get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        response = self.llm.invoke(messages, **kwargs)
+        self._set(key, response.content)
+        return response
+
+    def batch(self, messages_list: List[List[BaseMessage]], **kwargs: Any) -> List[AIMessage]:
+        """Batched invoke; only cache misses go to the provider."""
+        keys = [self._cache_key(messages) for messages in messages_list]
+        results: List[Optional[AIMessage]] = []
+        miss_indices = []
+        for i, key in enumerate(keys):
+            cached = self._get(key)
+            results.append(AIMessage(content=cached) if cached is not None else None)
+            if cached is None:
+                miss_indices.append(i)
+
+        if miss_indices:
+            responses = self.llm.batch(
+                [messages_list[i] for i in miss_indices], **kwargs
+            )
+            for i, response in zip(miss_indices, responses):
+                self._set(keys[i], response.content)
+                results[i] = response
+        return results
+
+    async def ainvoke(self, messages: List[BaseMessage], **kwargs: Any) -> AIMessage:
+        """Async invoke with the same cache semantics as invoke."""
+        key = self._cache_key(messages)
+        cached = self._get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        response = await self.llm.ainvoke(messages, **kwargs)
+        self._set(key, response.content)
+        return response
+
+    async def astream(self, messages: List[BaseMessage], **kwargs: Any):
+        """Async stream; a cache hit yields the full response as one chunk."""
+        key = self._cache_key(messages)
+        cached = self._get(key)
+        if cached is not None:
+            yield AIMessage(content=cached)
+            return
+
+        parts = []
+        async for chunk in self.llm.astream(messages, **kwargs):
+            parts.append(chunk.content or "")
+            yield chunk
+        self._set(key, "".join(parts))
@@ -1,59 +1,102 @@
-"""
-LLM Factory for creating configured Groq LLM instances.
-"""
-import os
-from typing import Optional
-from langchain_groq import ChatGroq
-
-
-class LLMFactory:
-    """Factory for creating configured LLM instances."""
-    
-    @staticmethod
-    def create_groq_llm(
-        model: str = "llama-3.3-70b-versatile",
-        temperature: float = 0.1,
-        max_tokens: Optional[int] = 1024,
-        timeout: Optional[int] = 60
-    ) -> ChatGroq:
-        """
-        Create a Groq LLM instance with conservative settings.
-        
-        Args:
-            model: Model name (llama-3.3-70b-versatile or llama-3.1-8b-instant)
-            temperature: Sampling temperature (0.0-1.0)
-            max_tokens: Maximum tokens to generate
-            timeout: Request timeout in seconds
-            
-        Returns:
-            Configured ChatGroq instance
-        """
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY environment variable is required")
-            
-        return ChatGroq(
-            groq_api_key=api_key,
-            model_name=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            timeout=timeout
-        )
-    
-    @staticmethod
-    def create_fast_llm() -> ChatGroq:
-        """Create a fast LLM for latency-sensitive operations."""
-        return LLMFactory.create_groq_llm(
-            model="llama-3.1-8b-instant",
-            temperature=0.0,
-            max_tokens=512
-        )
-    
-    @staticmethod
-    def create_reasoning_llm() -> ChatGroq:
-        """Create a reasoning LLM for complex analysis."""
-        return LLMFactory.create_groq_llm(
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=2048
-        )
\ No newline at end of file
+"""
+LLM Factory for creating configured Groq LLM instances.
+"""
+import functools
+import os
+from typing import Optional
+from langchain_groq import ChatGroq
+from core.http_clients import get_async_client, get_sync_client
+from core.llm_cache import CachedLLM
+
+# Process-wide clients shared with every other outbound HTTP caller
+_SHARED_HTTP_CLIENT = get_sync_client()
+_SHARED_ASYNC_HTTP_CLIENT = get_async_client()
+
+
+@functools.lru_cache(maxsize=None)
+def _create_groq_llm(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    timeout: Optional[int]
+) -> ChatGroq:
+    """
+    Build (or return the memoized) ChatGroq client for a configuration.
+
+    ChatGroq is a stateless client, so sharing one instance per
+    configuration lets all agents reuse a single HTTP connection pool
+    (TLS session + keep-alive) instead of each opening their own.
+    """
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise ValueError("GROQ_API_KEY environment variable is required")
+
+    kwargs = {}
+    if _SHARED_HTTP_CLIENT is not None:
+        kwargs["http_client"] = _SHARED_HTTP_CLIENT
+        kwargs["http_async_client"] = _SHARED_ASYNC_HTTP_CLIENT
+
+    return ChatGroq(
+        groq_api_key=api_key,
+        model_name=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        **kwargs
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _create_cached_llm(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    timeout: Optional[int]
+) -> CachedLLM:
+    """Memoized CachedLLM wrapper so the cache handle is shared too."""
+    return CachedLLM(_create_groq_llm(model, temperature, max_tokens, timeout))
+
+
+class LLMFactory:
+    """Factory for creating configured LLM instances."""
+
+    @staticmethod
+    def create_groq_llm(
+        model: str = "llama-3.3-70b-versatile",
+        temperature: float = 0.1,
+        max_tokens: Optional[int] = 1024,
+        timeout: Optional[int] = 60
+    ) -> ChatGroq:
+        """
+        Create a Groq LLM instance with conservative settings.
+
+        Args:
+            model: Model name (llama-3.3-70b-versatile or llama-3.1-8b-instant)
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            timeout: Request timeout in seconds
+
+        Returns:
+            Configured ChatGroq instance (shared per configuration)
+        """
+        return _create_groq_llm(model, temperature, max_tokens, timeout)
+
+    @staticmethod
+    def create_fast_llm() -> CachedLLM:
+        """Create a fast LLM for latency-sensitive operations."""
+        return _create_cached_llm(
+            model="llama-3.1-8b-instant",
+            temperature=0.0,
+            max_tokens=512,
+            timeout=60
+        )
+
+    @staticmethod
+    def create_reasoning_llm() -> CachedLLM:
+        """Create a reasoning LLM for complex analysis."""
+        return _create_cached_llm(
+            model="llama-3.3-70b-versatile",
+            temperature=0.1,
+            max_tokens=2048,
+            timeout=60
+        )
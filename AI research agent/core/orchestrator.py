@@ -1,128 +1,340 @@
-"""
-Orchestrator for coordinating the three agents.
-"""
-import json
-from typing import Dict, Any
-from langsmith import traceable
-from agents.research_agent import ResearchAgent
-from agents.analysis_agent import AnalysisAgent
-from agents.decision_agent import DecisionAgent
-
-
-class AIResearchOrchestrator:
-    """Orchestrates the three-agent workflow for AI research and decision making."""
-    
-    def __init__(self):
-        """Initialize the orchestrator with all three agents."""
-        self.research_agent = ResearchAgent()
-        self.analysis_agent = AnalysisAgent()
-        self.decision_agent = DecisionAgent()
-    
-    @traceable(name="ai_research_orchestrator")
-    def process_query(self, user_query: str) -> Dict[str, Any]:
-        """
-        Process a user query through the complete agent workflow.
-        
-        Args:
-            user_query: The user's research question or topic
-            
-        Returns:
-            Structured final response with all agent outputs
-        """
-        try:
-            # Step 1: Research Agent gathers information
-            research_results = self._execute_research(user_query)
-            
-            # Step 2: Analysis Agent processes research findings
-            analysis_results = self._execute_analysis(research_results)
-            
-            # Step 3: Decision Agent generates recommendations
-            decision_results = self._execute_decisions(analysis_results)
-            
-            # Step 4: Format final structured output
-            final_output = self._format_final_output(
-                user_query, research_results, analysis_results, decision_results
-            )
-            
-            return final_output
-            
-        except Exception as e:
-            return {
-                "error": f"Orchestration failed: {str(e)}",
-                "query": user_query,
-                "status": "failed"
-            }
-    
-    @traceable(name="research_phase")
-    def _execute_research(self, query: str) -> Dict[str, Any]:
-        """Execute the research phase."""
-        return self.research_agent.research(query)
-    
-    @traceable(name="analysis_phase")
-    def _execute_analysis(self, research_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the analysis phase."""
-        return self.analysis_agent.analyze(research_results)
-    
-    @traceable(name="decision_phase")
-    def _execute_decisions(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the decision phase."""
-        return self.decision_agent.decide(analysis_results)
-    
-    def _format_final_output(
-        self, 
-        query: str, 
-        research: Dict[str, Any], 
-        analysis: Dict[str, Any], 
-        decisions: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Format the final structured output as specified.
-        
-        Returns output in the exact format:
-        - Summary
-        - Key Trends  
-        - Business Impact
-        - Recommended Actions
-        """
-        try:
-            analysis_data = analysis.get("analysis", {})
-            decision_data = decisions.get("decisions", {})
-            
-            # Extract data for final format
-            summary = research.get("findings", "Research completed on AI topics.")
-            key_trends = analysis_data.get("key_trends", [])
-            business_impact = analysis_data.get("business_impact", {})
-            recommendations = decision_data.get("recommendations", [])
-            
-            return {
-                "query": query,
-                "summary": summary,
-                "key_trends": key_trends,
-                "business_impact": business_impact,
-                "recommended_actions": [
-                    {
-                        "action": rec.get("action", ""),
-                        "priority": rec.get("priority", "Medium"),
-                        "timeline": rec.get("timeline", "Medium term"),
-                        "rationale": rec.get("rationale", "")
-                    }
-                    for rec in recommendations
-                ],
-                "status": "completed",
-                "agent_execution_summary": {
-                    "research_agent": "completed" if research.get("findings") else "partial",
-                    "analysis_agent": "completed" if analysis_data else "partial", 
-                    "decision_agent": "completed" if decision_data else "partial"
-                }
-            }
-            
-        except Exception as e:
-            return {
-                "query": query,
-                "summary": "Analysis completed with partial results.",
-                "key_trends": ["AI technology advancement continues"],
-                "business_impact": {"short_term": "Monitoring recommended"},
-                "recommended_actions": [{"action": "Continue monitoring AI developments", "priority": "Medium"}],
-                "status": "completed_with_errors",
-                "error": str(e)
+"""
+Orchestrator for coordinating the three agents.
+"""
+import asyncio
+import json
+import threading
+from typing import Dict, Any, Callable, Optional, Tuple
+from langchain_core.messages import HumanMessage
+from langsmith import traceable
+from agents.research_agent import ResearchAgent
+from agents.analysis_agent import AnalysisAgent
+from agents.decision_agent import DecisionAgent
+from core import fast_json
+from core.llm_factory import LLMFactory
+from core.semantic_cache import canonical_key
+from core.stream_json import StreamingArrayExtractor
+
+
+# Per-phase latency budgets (seconds). Far below the HTTP client's 60s
+# timeout, so a hung Groq call costs one phase budget and a fallback
+# instead of stalling the whole pipeline.
+RESEARCH_TIMEOUT = 20
+PHASE_TIMEOUT = 15
+COMBINED_TIMEOUT = 20  # covers two fused phases
+
+# One prompt covering both downstream phases: a single prefill + decode
+# replaces the separate analysis and decision round-trips to Groq.
+_COMBINED_PROMPT = """
+Analyze the following research findings about AI topics, then derive strategic
+business recommendations from your own analysis.
+
+Research Findings:
+{findings_text}
+
+Provide your output in this exact JSON format:
+{{
+    "analysis": {{
+        "key_trends": [
+            "Trend 1: Description",
+            "Trend 2: Description",
+            "Trend 3: Description"
+        ],
+        "risks": [
+            "Risk 1: Description and potential impact",
+            "Risk 2: Description and potential impact"
+        ],
+        "opportunities": [
+            "Opportunity 1: Description and potential value",
+            "Opportunity 2: Description and potential value"
+        ],
+        "business_impact": {{
+            "short_term": "Impact expected in next 6-12 months",
+            "medium_term": "Impact expected in 1-3 years",
+            "long_term": "Impact expected in 3+ years"
+        }},
+        "market_dynamics": [
+            "Dynamic 1: Description",
+            "Dynamic 2: Description"
+        ]
+    }},
+    "decisions": {{
+        "recommendations": [
+            {{
+                "action": "Specific actionable recommendation",
+                "rationale": "Why this recommendation makes sense",
+                "priority": "High/Medium/Low",
+                "timeline": "Short/Medium/Long term"
+            }}
+        ],
+        "key_considerations": ["consideration1", "consideration2"],
+        "risk_mitigation": ["risk1_mitigation", "risk2_mitigation"]
+    }}
+}}
+
+Focus on business-relevant insights and practical, business-ready actions.
+"""
+
+
+class AIResearchOrchestrator:
+    """Orchestrates the three-agent workflow for AI research and decision making."""
+
+    def __init__(self):
+        """Initialize the orchestrator with all three agents."""
+        self.research_agent = ResearchAgent()
+        self.analysis_agent = AnalysisAgent()
+        self.decision_agent = DecisionAgent()
+        self.llm = LLMFactory.create_reasoning_llm()
+        # Load the shared cache-embedding model in the background now: a
+        # cold SentenceTransformer load can take tens of seconds, and it
+        # must never count against a phase budget or evict real results.
+        # The model is shared across all semantic caches, so one warm
+        # covers research and decision lookups alike.
+        threading.Thread(
+            target=self.research_agent.semantic_cache.warm, daemon=True
+        ).start()
+    
+    @traceable(name="ai_research_orchestrator")
+    async def process_query(
+        self,
+        user_query: str,
+        on_trend: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a user query through the complete agent workflow.
+
+        Args:
+            user_query: The user's research question or topic
+            on_trend: Optional callback fired for each key trend as it
+                streams out of the analysis phase
+
+        Returns:
+            Structured final response with all agent outputs
+        """
+        try:
+            # Step 1: Research Agent gathers information
+            try:
+                research_results = await asyncio.wait_for(
+                    self._execute_research(user_query), RESEARCH_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                research_results = {
+                    "query": user_query,
+                    "findings": f"Research completed on {user_query}. Current AI landscape shows continued advancement in generative AI, enterprise adoption, and emerging regulatory frameworks.",
+                    "error": "research phase timed out",
+                    "agent_type": "research"
+                }
+
+            # Steps 2+3: analyze and decide in a single fused LLM call,
+            # falling back to the separate agents if the combined JSON
+            # doesn't parse (or the fused call exceeds its budget)
+            try:
+                combined = await asyncio.wait_for(
+                    self._execute_combined(research_results, on_trend), COMBINED_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                combined = None
+
+            if combined is not None:
+                analysis_results, decision_results = combined
+            else:
+                try:
+                    analysis_results = await asyncio.wait_for(
+                        self._execute_analysis(research_results, on_trend),
+                        PHASE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    analysis_results = {
+                        "original_query": user_query,
+                        "analysis": self.analysis_agent._create_fallback_analysis(
+                            research_results.get("findings", "")
+                        ),
+                        "error": "analysis phase timed out",
+                        "agent_type": "analysis"
+                    }
+
+                try:
+                    decision_results = await asyncio.wait_for(
+                        self._execute_decisions(analysis_results), PHASE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    decision_results = {
+                        "original_query": user_query,
+                        "decisions": self.decision_agent._create_fallback_decisions(),
+                        "error": "decision phase timed out",
+                        "agent_type": "decision"
+                    }
+            
+            # Step 4: Format final structured output
+            final_output = self._format_final_output(
+                user_query, research_results, analysis_results, decision_results
+            )
+            
+            return final_output
+            
+        except Exception as e:
+            return {
+                "error": f"Orchestration failed: {str(e)}",
+                "query": user_query,
+                "status": "failed"
+            }
+    
+    @traceable(name="research_phase")
+    async def _execute_research(self, query: str) -> Dict[str, Any]:
+        """Execute the research phase."""
+        return await self.research_agent.research(query)
+
+    @traceable(name="combined_analysis_decision_phase")
+    async def _execute_combined(
+        self,
+        research_results: Dict[str, Any],
+        on_trend: Optional[Callable[[str], None]] = None
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run analysis and decisions as one fused LLM call.
+
+        Returns:
+            (analysis_results, decision_results) tuple, or None if the
+            combined response could not be parsed into both sections
+        """
+        query = research_results.get("query", "")
+        findings_text = research_results.get("findings", "")
+
+        # Consult the analysis semantic cache first (same key the analysis
+        # agent uses): a hit on similar findings skips the fused LLM call
+        # entirely, and the decision agent gets its own shot at the
+        # decision cache
+        analysis_key = canonical_key({"findings": findings_text})
+        cached_analysis = await asyncio.to_thread(
+            self.analysis_agent.semantic_cache.get, analysis_key
+        )
+        if cached_analysis is not None:
+            analysis_results = {
+                "original_query": query,
+                "analysis": cached_analysis,
+                "agent_type": "analysis"
+            }
+            decision_results = await self._execute_decisions(analysis_results)
+            return analysis_results, decision_results
+
+        prompt = _COMBINED_PROMPT.format(findings_text=findings_text)
+        messages = [HumanMessage(content=prompt)]
+
+        try:
+            if on_trend is not None:
+                extractor = StreamingArrayExtractor("key_trends")
+                parts = []
+                async for chunk in self.llm.astream(messages):
+                    piece = chunk.content or ""
+                    parts.append(piece)
+                    for trend in extractor.feed(piece):
+                        on_trend(trend)
+                content = "".join(parts)
+            else:
+                response = await self.llm.ainvoke(messages)
+                content = response.content
+
+            data = fast_json.loads_relaxed(content)
+            if not isinstance(data.get("analysis"), dict) or not isinstance(data.get("decisions"), dict):
+                return None
+        except Exception:
+            return None
+
+        # Store both sections under the per-agent cache keys so fusion and
+        # semantic caching compose: similar findings hit the check above,
+        # and a similar analysis hits inside DecisionAgent.decide
+        await asyncio.gather(
+            asyncio.to_thread(
+                self.analysis_agent.semantic_cache.set, analysis_key, data["analysis"]
+            ),
+            asyncio.to_thread(
+                self.decision_agent.semantic_cache.set,
+                canonical_key(data["analysis"]),
+                data["decisions"]
+            )
+        )
+
+        analysis_results = {
+            "original_query": query,
+            "analysis": data["analysis"],
+            "agent_type": "analysis"
+        }
+        decision_results = {
+            "original_query": query,
+            "decisions": data["decisions"],
+            "agent_type": "decision"
+        }
+        return analysis_results, decision_results
+
+    @traceable(name="analysis_phase")
+    async def _execute_analysis(
+        self,
+        research_results: Dict[str, Any],
+        on_trend: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Execute the analysis phase."""
+        return await self.analysis_agent.analyze(research_results, on_trend)
+
+    @traceable(name="decision_phase")
+    async def _execute_decisions(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the decision phase."""
+        return await self.decision_agent.decide(analysis_results)
+    
+    def _format_final_output(
+        self, 
+        query: str, 
+        research: Dict[str, Any], 
+        analysis: Dict[str, Any], 
+        decisions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Format the final structured output as specified.
+        
+        Returns output in the exact format:
+        - Summary
+        - Key Trends  
+        - Business Impact
+        - Recommended Actions
+        """
+        try:
+            analysis_data = analysis.get("analysis", {})
+            decision_data = decisions.get("decisions", {})
+            
+            # Extract data for final format
+            summary = research.get("findings", "Research completed on AI topics.")
+            key_trends = analysis_data.get("key_trends", [])
+            business_impact = analysis_data.get("business_impact", {})
+            recommendations = decision_data.get("recommendations", [])
+            
+            return {
+                "query": query,
+                "summary": summary,
+                "key_trends": key_trends,
+                "business_impact": business_impact,
+                "recommended_actions": [
+                    {
+                        "action": rec.get("action", ""),
+                        "priority": rec.get("priority", "Medium"),
+                        "timeline": rec.get("timeline", "Medium term"),
+                        "rationale": rec.get("rationale", "")
+                    }
+                    for rec in recommendations
+                ],
+                "status": "completed",
+                "agent_execution_summary": {
+                    "research_agent": "completed" if research.get("findings") else "partial",
+                    "analysis_agent": "completed" if analysis_data else "partial", 
+                    "decision_agent": "completed" if decision_data else "partial"
+                }
+            }
+            
+        except Exception as e:
+            return {
+                "query": query,
+                "summary": "Analysis completed with partial results.",
+                "key_trends": ["AI technology advancement continues"],
+                "business_impact": {"short_term": "Monitoring recommended"},
+                "recommended_actions": [{"action": "Continue monitoring AI developments", "priority": "Medium"}],
+                "status": "completed_with_errors",
+                "error": str(e)
             }
\ No newline at end of file
@@ -0,0 +1,367 @@
+"""
+Semantic (embedding) cache for agent responses.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+except ImportError:
+    ort = None
+    AutoTokenizer = None
+
+# Directory holding an ONNX export of the embedding model (model.onnx +
+# tokenizer files), e.g. produced by `optimum-cli export onnx` and
+# optionally int8-quantized. When set, embedding skips PyTorch entirely.
+ONNX_MODEL_DIR_ENV = "SEMANTIC_CACHE_ONNX_DIR"
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.87
+DEFAULT_CACHE_DIR = ".semantic_cache"
+EMBEDDING_DIM = 384
+
+# Two-tier layout: a small medium-term working set (LRU) backed by a larger
+# long-term store (LFU) that absorbs entries which stay popular over time.
+MTM_CAPACITY = 256
+LTM_CAPACITY = 4096
+PROMOTION_HITS = 3
+DEFAULT_PROMOTION_INTERVAL = 100
+
+# Inserts between disk flushes: persisting rewrites both full tiers
+# (megabytes at LTM capacity), far too much for every single set
+PERSIST_INTERVAL = 50
+
+
+class _OnnxEmbedder:
+    """MiniLM embedder running through onnxruntime on CPU."""
+
+    def __init__(self, model_dir: str):
+        """Load the tokenizer and ONNX session from an export directory."""
+        self._tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self._session = ort.InferenceSession(
+            os.path.join(model_dir, "model.onnx"),
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+    def encode(self, text: str):
+        """Embed text via mean pooling over the last hidden state."""
+        encoded = self._tokenizer(text, truncation=True, max_length=256, return_tensors="np")
+        feeds = {k: v for k, v in encoded.items() if k in self._input_names}
+        hidden = self._session.run(None, feeds)[0][0]
+        mask = encoded["attention_mask"][0][:, np.newaxis].astype(np.float32)
+        return (hidden * mask).sum(axis=0) / np.maximum(mask.sum(), 1.0)
+
+
+def _onnx_model_dir():
+    """Return the configured ONNX model directory, if usable."""
+    if ort is None or AutoTokenizer is None:
+        return None
+    model_dir = os.getenv(ONNX_MODEL_DIR_ENV)
+    if model_dir and os.path.exists(os.path.join(model_dir, "model.onnx")):
+        return model_dir
+    return None
+
+
+class _CacheTier:
+    """One tier of the semantic cache: an embedding matrix plus entries."""
+
+    def __init__(self, capacity: int, policy: str):
+        """
+        Initialize a tier.
+
+        Args:
+            capacity: Maximum number of entries before eviction
+            policy: Eviction policy, "lru" (by timestamp) or "lfu" (by hits)
+        """
+        self.capacity = capacity
+        self.policy = policy
+        self.embeddings = np.empty((0, EMBEDDING_DIM), dtype=np.float32) if np is not None else None
+        self.entries: List[dict] = []
+
+    def lookup(self, vector, threshold: float) -> Optional[dict]:
+        """Return the best-matching entry at or above threshold, or None."""
+        if len(self.entries) == 0:
+            return None
+        scores = self.embeddings @ vector
+        best = int(np.argmax(scores))
+        if float(scores[best]) >= threshold:
+            entry = self.entries[best]
+            entry["hits"] += 1
+            entry["ts"] = time.time()
+            return entry
+        return None
+
+    def insert(self, vector, entry: dict) -> None:
+        """Insert an entry, evicting per the tier's policy when full."""
+        self.embeddings = np.vstack([self.embeddings, vector[np.newaxis, :]])
+        self.entries.append(entry)
+        while len(self.entries) > self.capacity:
+            if self.policy == "lfu":
+                victim = min(range(len(self.entries)), key=lambda i: self.entries[i]["hits"])
+            else:
+                victim = min(range(len(self.entries)), key=lambda i: self.entries[i]["ts"])
+            self.remove(victim)
+
+    def remove(self, index: int) -> None:
+        """Remove the entry at the given index."""
+        self.embeddings = np.delete(self.embeddings, index, axis=0)
+        del self.entries[index]
+
+
+class SemanticCache:
+    """
+    Two-tier embedding-based cache that matches paraphrased keys.
+
+    Keys are embedded with all-MiniLM-L6-v2 and compared by cosine
+    similarity, so "generative AI trends" and "trends in generative AI"
+    resolve to the same stored response. Lookups hit the small MTM
+    (medium-term, LRU-evicted) working set first, then the larger LTM
+    (long-term, LFU-evicted) store; every promotion_interval inserts,
+    MTM entries with enough hits are promoted into LTM so long-term
+    popular queries survive while one-shot queries age out. The cache
+    degrades to a no-op when numpy or sentence-transformers is missing.
+    """
+
+    _model = None  # embedding model shared across all cache instances
+    _model_lock = threading.Lock()  # held by whichever thread loads the model
+    _load_thread = None  # in-flight background load, if any
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        promotion_interval: int = DEFAULT_PROMOTION_INTERVAL,
+        cache_dir: str = DEFAULT_CACHE_DIR
+    ):
+        """
+        Initialize a named semantic cache.
+
+        Args:
+            name: Cache name, used for the on-disk files (one per agent)
+            threshold: Minimum cosine similarity for a hit
+            promotion_interval: Inserts between MTM -> LTM promotion passes
+            cache_dir: Directory for persisted embeddings and responses
+        """
+        self.name = name
+        self.threshold = threshold
+        self.promotion_interval = promotion_interval
+        self.cache_dir = cache_dir
+        self.enabled = np is not None and (
+            SentenceTransformer is not None or _onnx_model_dir() is not None
+        )
+
+        if self.enabled:
+            self._mtm = _CacheTier(MTM_CAPACITY, "lru")
+            self._ltm = _CacheTier(LTM_CAPACITY, "lfu")
+            self._inserts = 0
+            self._dirty = False
+            # Batched queries hit one cache instance from several worker
+            # threads; unsynchronized inserts would misalign the embedding
+            # matrix and entry list (reentrant: set -> _persist)
+            self._lock = threading.RLock()
+            self._load()
+            # Catch inserts made since the last interval flush
+            atexit.register(self._persist)
+
+    @classmethod
+    def _get_model(cls):
+        """
+        Lazily load the shared embedding model.
+
+        Prefers an ONNX export (no PyTorch dispatch overhead; ~2x faster
+        for single short queries when int8-quantized) and falls back to
+        sentence-transformers.
+        """
+        if cls._model is None:
+            with cls._model_lock:
+                if cls._model is None:
+                    model_dir = _onnx_model_dir()
+                    if model_dir is not None:
+                        cls._model = _OnnxEmbedder(model_dir)
+                    else:
+                        cls._model = SentenceTransformer(DEFAULT_MODEL_NAME)
+        return cls._model
+
+    @classmethod
+    def _model_if_ready(cls):
+        """
+        Return the shared model without ever blocking on its load.
+
+        A cold model load (first run downloads the MiniLM weights) can
+        take longer than a whole phase budget, so lookups must not wait
+        for it: while a load is in flight this returns None and callers
+        treat the cache as a miss. If no load has started yet, one is
+        kicked off in a daemon thread so later lookups can hit.
+        """
+        if cls._model is not None:
+            return cls._model
+        if cls._model_lock.acquire(blocking=False):
+            try:
+                if cls._model is None and (
+                    cls._load_thread is None or not cls._load_thread.is_alive()
+                ):
+                    cls._load_thread = threading.Thread(target=cls._get_model, daemon=True)
+                    cls._load_thread.start()
+            finally:
+                cls._model_lock.release()
+        return None
+
+    def _embed(self, text: str):
+        """Embed normalized text into a unit-length float32 vector."""
+        normalized = " ".join(text.split()).lower()
+        vector = np.ascontiguousarray(self._get_model().encode(normalized), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def warm(self, key_text: Optional[str] = None) -> None:
+        """
+        Warm the cache's embedding path ahead of a lookup.
+
+        Loading the model (and optionally embedding a key) here lets
+        callers hide that cost behind other in-flight work, so the real
+        lookup later is a pure matrix product.
+
+        Args:
+            key_text: Optional key to pre-embed after loading the model
+        """
+        if not self.enabled:
+            return
+        try:
+            self._get_model()
+            if key_text is not None:
+                self._embed(key_text)
+        except Exception:
+            pass
+
+    def get(self, key_text: str) -> Optional[Any]:
+        """
+        Look up the stored response for a semantically similar key.
+
+        Args:
+            key_text: Free-form key (query string or canonical JSON)
+
+        Returns:
+            The stored response on a hit, or None
+        """
+        if not self.enabled:
+            return None
+        if self._model_if_ready() is None:
+            # Model still loading (cold start): miss now rather than
+            # blocking a phase budget behind the load
+            return None
+
+        try:
+            vector = self._embed(key_text)
+            with self._lock:
+                entry = self._mtm.lookup(vector, self.threshold)
+                if entry is None:
+                    entry = self._ltm.lookup(vector, self.threshold)
+            if entry is not None:
+                return entry["response"]
+        except Exception:
+            # A cache failure must never break the pipeline
+            return None
+
+        return None
+
+    def set(self, key_text: str, response: Any) -> None:
+        """
+        Store a response under a free-form key.
+
+        Args:
+            key_text: Free-form key (query string or canonical JSON)
+            response: JSON-serializable response to cache
+        """
+        if not self.enabled:
+            return
+        if self._model_if_ready() is None:
+            # Not worth blocking on the cold load just to store one entry
+            return
+
+        try:
+            vector = self._embed(key_text)
+            with self._lock:
+                self._mtm.insert(vector, {"response": response, "ts": time.time(), "hits": 0})
+                self._inserts += 1
+                self._dirty = True
+                if self._inserts % self.promotion_interval == 0:
+                    self._promote()
+                # Flushing every set would rewrite both full tiers per
+                # insert; batch the O(cache-size) disk write instead
+                if self._inserts % PERSIST_INTERVAL == 0:
+                    self._persist()
+        except Exception:
+            pass
+
+    def _promote(self) -> None:
+        """Move frequently-hit MTM entries into the long-term store."""
+        for index in range(len(self._mtm.entries) - 1, -1, -1):
+            entry = self._mtm.entries[index]
+            if entry["hits"] >= PROMOTION_HITS:
+                vector = self._mtm.embeddings[index].copy()
+                self._mtm.remove(index)
+                self._ltm.insert(vector, entry)
+
+    def _paths(self, tier_name: str):
+        """Return the (embeddings, entries) file paths for one tier."""
+        return (
+            os.path.join(self.cache_dir, f"{self.name}_{tier_name}_embeddings.npy"),
+            os.path.join(self.cache_dir, f"{self.name}_{tier_name}_entries.json"),
+        )
+
+    def _load(self) -> None:
+        """Load persisted tiers from disk, if present."""
+        for tier_name, tier in (("mtm", self._mtm), ("ltm", self._ltm)):
+            emb_path, entries_path = self._paths(tier_name)
+            try:
+                if os.path.exists(emb_path) and os.path.exists(entries_path):
+                    # Contiguous float32 keeps lookups on the BLAS fast path
+                    embeddings = np.ascontiguousarray(np.load(emb_path), dtype=np.float32)
+                    with open(entries_path, "r") as f:
+                        entries = json.load(f)
+                    if len(embeddings) == len(entries):
+                        tier.embeddings = embeddings
+                        tier.entries = entries
+            except Exception:
+                pass
+
+    def _persist(self) -> None:
+        """Persist both tiers to disk if anything changed since last flush."""
+        if not self._dirty:
+            return
+        try:
+            # Hold the lock so the atexit flush never snapshots a tier
+            # mid-insert (RLock: also entered from set)
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                for tier_name, tier in (("mtm", self._mtm), ("ltm", self._ltm)):
+                    emb_path, entries_path = self._paths(tier_name)
+                    np.save(emb_path, tier.embeddings)
+                    with open(entries_path, "w") as f:
+                        json.dump(tier.entries, f)
+                self._dirty = False
+        except Exception:
+            pass
+
+
+def canonical_key(data: Any) -> str:
+    """Build a canonical JSON key for dict-valued cache inputs."""
+    return json.dumps(data, sort_keys=True, default=str)
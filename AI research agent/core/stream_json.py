@@ -0,0 +1,110 @@
+"""
+Incremental extraction of array items from streamed JSON text.
+"""
+from typing import List
+
+# Standard JSON single-character escapes; \uXXXX is handled separately
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class StreamingArrayExtractor:
+    """
+    Extracts string items of one array field from streamed JSON text.
+
+    Feed raw LLM chunks as they arrive; completed items of the target
+    array (e.g. "key_trends") are returned as soon as their closing quote
+    streams in, without waiting for — or fully parsing — the rest of the
+    document. Incomplete fragments are buffered across chunk boundaries.
+    Assumes the target array holds flat strings, which matches the JSON
+    schemas the agents request.
+    """
+
+    def __init__(self, field: str):
+        """
+        Initialize the extractor for one array field.
+
+        Args:
+            field: Name of the JSON key whose array items to extract
+        """
+        self._marker = f'"{field}"'
+        self._buffer = ""
+        self._pos = 0
+        self._state = "seeking"  # seeking -> array -> done
+        self._in_string = False
+        self._escaped = False
+        self._depth = 0
+        self._current: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            chunk: Raw text fragment from the LLM stream
+
+        Returns:
+            Array items completed by this chunk (possibly empty)
+        """
+        self._buffer += chunk
+        items: List[str] = []
+
+        if self._state == "seeking":
+            marker_idx = self._buffer.find(self._marker)
+            if marker_idx < 0:
+                return items
+            open_idx = self._buffer.find("[", marker_idx + len(self._marker))
+            if open_idx < 0:
+                return items
+            self._pos = open_idx + 1
+            self._state = "array"
+
+        if self._state == "array":
+            while self._pos < len(self._buffer):
+                char = self._buffer[self._pos]
+                self._pos += 1
+                if self._in_string:
+                    if self._escaped:
+                        if char == "u":
+                            if self._pos + 4 > len(self._buffer):
+                                # The \uXXXX digits haven't streamed in yet;
+                                # rewind to the backslash and wait for more
+                                self._pos -= 2
+                                self._escaped = False
+                                break
+                            digits = self._buffer[self._pos:self._pos + 4]
+                            self._pos += 4
+                            try:
+                                self._current.append(chr(int(digits, 16)))
+                            except ValueError:
+                                self._current.append("\\u" + digits)
+                        else:
+                            self._current.append(_ESCAPES.get(char, char))
+                        self._escaped = False
+                    elif char == "\\":
+                        self._escaped = True
+                    elif char == '"':
+                        self._in_string = False
+                        items.append("".join(self._current))
+                        self._current = []
+                    else:
+                        self._current.append(char)
+                elif char == '"':
+                    self._in_string = True
+                elif char in "[{":
+                    self._depth += 1
+                elif char == "]" and self._depth == 0:
+                    self._state = "done"
+                    break
+                elif char in "]}":
+                    self._depth -= 1
+
+        return items
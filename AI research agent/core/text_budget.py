@@ -0,0 +1,90 @@
+"""
+Token budgeting and extractive compression for research content.
+"""
+import re
+from collections import Counter
+
+try:
+    import tiktoken
+    _ENCODER = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _ENCODER = None
+
+# Budget for content handed to the reasoning model; anything under this
+# fits the prompt without an extra summarization LLM call
+DEFAULT_TOKEN_BUDGET = 3000
+
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]?")
+_WORD_RE = re.compile(r"\w+")
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens with tiktoken, or estimate (~4 chars/token) without it.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Token count
+    """
+    if _ENCODER is not None:
+        return len(_ENCODER.encode(text))
+    return max(1, len(text) // 4)
+
+
+def compress_to_budget(text: str, query: str, budget: int = DEFAULT_TOKEN_BUDGET) -> str:
+    """
+    Extractively compress text to fit a token budget.
+
+    Sentences are scored by overlap with the query terms plus their
+    average term frequency in the document, then the highest-scoring
+    sentences are kept (in original order) until the budget is filled.
+    This is a cheap first-stage filter that often makes a follow-up
+    LLM summarization unnecessary.
+
+    Args:
+        text: Text to compress
+        query: Query whose terms indicate relevance
+        budget: Target token budget
+
+    Returns:
+        Compressed text within the budget (best effort)
+    """
+    sentences = [s.strip() for s in _SENTENCE_RE.findall(text) if s.strip()]
+    if len(sentences) <= 1:
+        return text
+
+    query_terms = {w.lower() for w in _WORD_RE.findall(query)}
+    frequencies = Counter(w.lower() for w in _WORD_RE.findall(text))
+
+    def score(sentence: str) -> float:
+        words = [w.lower() for w in _WORD_RE.findall(sentence)]
+        if not words:
+            return 0.0
+        overlap = sum(1 for w in words if w in query_terms)
+        avg_frequency = sum(frequencies[w] for w in words) / len(words)
+        return overlap * 2.0 + avg_frequency
+
+    ranked = sorted(range(len(sentences)), key=lambda i: score(sentences[i]), reverse=True)
+
+    kept = []
+    used = 0
+    for index in ranked:
+        tokens = count_tokens(sentences[index])
+        if used + tokens > budget:
+            # Ranking is by score, not size, so an oversized sentence is
+            # skipped rather than ending the loop — smaller lower-ranked
+            # sentences may still fit the remaining budget
+            continue
+        kept.append(index)
+        used += tokens
+
+    if not kept:
+        # Nothing fit (e.g. one giant top sentence): hand back the
+        # original text so the caller's follow-up summarization runs
+        # instead of silently discarding the findings
+        return text
+
+    kept.sort()
+    return " ".join(sentences[i] for i in kept)
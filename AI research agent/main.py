@@ -1,17 +1,21 @@
 """
 Main application for AI Research & Decision Assistant.
 """
+import asyncio
+import functools
 import os
-import json
+import shutil
 import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 from dotenv import load_dotenv
 from langsmith import traceable
+from core import fast_json
 from core.orchestrator import AIResearchOrchestrator
 
 
+@functools.cache
 def setup_environment() -> None:
-    """Setup environment variables and LangSmith tracing."""
+    """Setup environment variables and LangSmith tracing (once per process)."""
     load_dotenv()
     
     # Verify required environment variables
@@ -26,65 +30,71 @@ def setup_environment() -> None:
     os.environ.setdefault("LANGCHAIN_PROJECT", "ai-research-assistant")
     
     print("✅ Environment setup complete")
-    print(f"📊 LangSmith Project: {os.getenv('LANGCHAIN_PROJECT', 'ai-research-assistant')}")
+    print(f"📊 LangSmith Project: {os.environ['LANGCHAIN_PROJECT']}")
+
+
+_SEP = "=" * 50
 
 
 def format_output(result: Dict[str, Any]) -> str:
     """
     Format the final output in the required structure.
-    
+
     Args:
         result: Orchestrator output
-        
+
     Returns:
         Formatted string output
     """
-    output_lines = []
-    
+    return "\n".join(_iter_output_lines(result))
+
+
+def _iter_output_lines(result: Dict[str, Any]):
+    """Yield the formatted output lines for a single result."""
+    summary = result.get("summary", "No summary available")
+    trends = result.get("key_trends", [])
+    impact = result.get("business_impact", {})
+    actions = result.get("recommended_actions", [])
+
     # Summary
-    output_lines.append("📋 SUMMARY")
-    output_lines.append("=" * 50)
-    output_lines.append(result.get("summary", "No summary available"))
-    output_lines.append("")
-    
+    yield "📋 SUMMARY"
+    yield _SEP
+    yield summary
+    yield ""
+
     # Key Trends
-    output_lines.append("📈 KEY TRENDS")
-    output_lines.append("=" * 50)
-    trends = result.get("key_trends", [])
+    yield "📈 KEY TRENDS"
+    yield _SEP
     if trends:
         for i, trend in enumerate(trends, 1):
-            output_lines.append(f"{i}. {trend}")
+            yield f"{i}. {trend}"
     else:
-        output_lines.append("No specific trends identified")
-    output_lines.append("")
-    
+        yield "No specific trends identified"
+    yield ""
+
     # Business Impact
-    output_lines.append("💼 BUSINESS IMPACT")
-    output_lines.append("=" * 50)
-    impact = result.get("business_impact", {})
+    yield "💼 BUSINESS IMPACT"
+    yield _SEP
     if impact:
         for timeframe, description in impact.items():
-            output_lines.append(f"• {timeframe.replace('_', ' ').title()}: {description}")
+            yield f"• {timeframe.replace('_', ' ').title()}: {description}"
     else:
-        output_lines.append("Business impact assessment pending")
-    output_lines.append("")
-    
+        yield "Business impact assessment pending"
+    yield ""
+
     # Recommended Actions
-    output_lines.append("🎯 RECOMMENDED ACTIONS")
-    output_lines.append("=" * 50)
-    actions = result.get("recommended_actions", [])
+    yield "🎯 RECOMMENDED ACTIONS"
+    yield _SEP
     if actions:
         for i, action in enumerate(actions, 1):
-            output_lines.append(f"{i}. {action.get('action', 'No action specified')}")
-            output_lines.append(f"   Priority: {action.get('priority', 'Medium')}")
-            output_lines.append(f"   Timeline: {action.get('timeline', 'Medium term')}")
+            yield f"{i}. {action.get('action', 'No action specified')}"
+            yield f"   Priority: {action.get('priority', 'Medium')}"
+            yield f"   Timeline: {action.get('timeline', 'Medium term')}"
             if action.get('rationale'):
-                output_lines.append(f"   Rationale: {action.get('rationale')}")
-            output_lines.append("")
+                yield f"   Rationale: {action.get('rationale')}"
+            yield ""
     else:
-        output_lines.append("No specific actions recommended")
-    
-    return "\n".join(output_lines)
+        yield "No specific actions recommended"
 
 
 def get_user_query() -> str:
@@ -117,7 +127,7 @@ def get_user_query() -> str:
             choice = input("\nEnter your choice (1-3): ").strip()
             
             if choice == "1":
-                print("\n📝 Enter your AI research query:")
+                print("\n📝 Enter your AI research query (separate multiple queries with ';'):")
                 query = input("Query: ").strip()
                 if query:
                     return query
@@ -157,66 +167,124 @@ def get_user_query() -> str:
             print(f"❌ Error: {e}")
 
 
-@traceable(name="main_application")
-def main() -> None:
-    """Main application entry point."""
-    try:
-        # Setup environment
-        setup_environment()
-        
-        # Initialize orchestrator
-        print("🤖 Initializing AI Research & Decision Assistant...")
-        orchestrator = AIResearchOrchestrator()
-        
-        # Get query from user
-        query = get_user_query()
-        
-        print(f"\n🔍 Processing your query...")
-        print(f"📋 Query: {query}")
+async def process_queries(orchestrator: AIResearchOrchestrator, queries: List[str]) -> List[Dict[str, Any]]:
+    """
+    Process one or more queries concurrently through the orchestrator.
+
+    Since each pipeline is I/O-bound on LLM calls, a batch of N queries
+    completes in roughly the time of the slowest one rather than the sum.
+
+    Args:
+        orchestrator: Shared orchestrator instance
+        queries: Queries to process
+
+    Returns:
+        List of orchestrator results, one per query in order
+    """
+    return await asyncio.gather(*(orchestrator.process_query(q) for q in queries))
+
+
+def _ask_another() -> bool:
+    """Ask whether to analyze another query (blocking prompt)."""
+    while True:
+        try:
+            another = input("🔄 Would you like to analyze another query? (y/n): ").strip().lower()
+            if another in ['y', 'yes']:
+                print("\n" + "="*60)
+                return True
+            elif another in ['n', 'no']:
+                print("👋 Thank you for using AI Research & Decision Assistant!")
+                return False
+            else:
+                print("❌ Please enter 'y' for yes or 'n' for no")
+        except KeyboardInterrupt:
+            print("\n👋 Goodbye!")
+            return False
+
+
+async def _async_main() -> None:
+    """
+    Run the interactive session under one long-lived event loop.
+
+    The shared httpx.AsyncClient injected into the memoized Groq clients
+    binds its pooled connections to the loop they were created on, so
+    the whole session must run inside a single asyncio.run — one run per
+    query would reuse (and close) those connections across different
+    loops and break every async LLM call from the second query onward.
+    """
+    # Initialize orchestrator once; it is reused across queries
+    print("🤖 Initializing AI Research & Decision Assistant...")
+    orchestrator = AIResearchOrchestrator()
+
+    while True:
+        # Get one or more ';'-separated queries from user (the blocking
+        # prompt runs in a worker thread to keep the loop free)
+        query = await asyncio.to_thread(get_user_query)
+        queries = [part.strip() for part in query.split(";") if part.strip()] or [query]
+
+        print(f"\n🔍 Processing your {'queries' if len(queries) > 1 else 'query'}...")
+        for q in queries:
+            print(f"📋 Query: {q}")
         print("\n⏳ This may take 15-30 seconds...")
-        
-        # Process the query
-        result = orchestrator.process_query(query)
-        
+
+        if len(queries) > 1:
+            # Batched path: the pipelines overlap, so N queries cost
+            # roughly the slowest one. Trend streaming stays off here —
+            # interleaved callbacks from concurrent runs would garble
+            results = await process_queries(orchestrator, queries)
+        else:
+            # Process the query, printing trends as soon as they stream in
+            results = [await orchestrator.process_query(
+                queries[0], on_trend=lambda trend: print(f"📈 {trend}")
+            )]
+
         # Format and display output
         print("\n" + "="*60)
         print("🎯 AI RESEARCH & DECISION ASSISTANT RESULTS")
         print("="*60)
-        print(format_output(result))
-        
-        # Save results to file with timestamp
-        import datetime
+        for q, result in zip(queries, results):
+            if len(queries) > 1:
+                print(f"\n📋 Query: {q}")
+            print(format_output(result))
+
+        # Save results to file with timestamp; serialize once and link
+        # results.json to the timestamped file instead of writing the
+        # same bytes twice
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"results_{timestamp}.json"
-        
+
+        # A single query keeps the historical flat-object file shape;
+        # batches save the list of results
+        payload = results[0] if len(results) == 1 else results
         with open(filename, "w") as f:
-            json.dump(result, f, indent=2)
-        
-        # Also save as latest results
-        with open("results.json", "w") as f:
-            json.dump(result, f, indent=2)
-        
+            f.write(fast_json.dumps(payload, indent=True))
+
+        try:
+            tmp_link = "results.json.tmp"
+            if os.path.lexists(tmp_link):
+                os.remove(tmp_link)
+            os.symlink(filename, tmp_link)
+            os.replace(tmp_link, "results.json")
+        except OSError:
+            # Symlinks unavailable (e.g. Windows); copy the bytes instead
+            shutil.copyfile(filename, "results.json")
+
         print(f"💾 Results saved to {filename} and results.json")
         print("📊 Check LangSmith for detailed traces and performance metrics")
-        
+
         # Ask if user wants to run another query
         print("\n" + "="*60)
-        while True:
-            try:
-                another = input("🔄 Would you like to analyze another query? (y/n): ").strip().lower()
-                if another in ['y', 'yes']:
-                    print("\n" + "="*60)
-                    main()  # Recursive call for another query
-                    break
-                elif another in ['n', 'no']:
-                    print("👋 Thank you for using AI Research & Decision Assistant!")
-                    break
-                else:
-                    print("❌ Please enter 'y' for yes or 'n' for no")
-            except KeyboardInterrupt:
-                print("\n👋 Goodbye!")
-                break
-        
+        if not await asyncio.to_thread(_ask_another):
+            break
+
+
+@traceable(name="main_application")
+def main() -> None:
+    """Main application entry point."""
+    try:
+        # Setup environment
+        setup_environment()
+        asyncio.run(_async_main())
     except Exception as e:
         print(f"❌ Application error: {str(e)}")
         print("🔧 Please check your API keys and try again")
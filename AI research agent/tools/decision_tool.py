@@ -1,13 +1,52 @@
 """
 Decision tool for generating strategic recommendations.
 """
-import json
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Union
 from langchain.tools import BaseTool
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
+from core import fast_json
 from core.llm_factory import LLMFactory
 
 
+@lru_cache(maxsize=1)
+def _get_reasoning_llm():
+    """Resolve the shared reasoning LLM once instead of per tool call."""
+    return LLMFactory.create_reasoning_llm()
+
+
+# All static instructions live in a system message: it is byte-identical
+# across calls, so provider-side prefix caching can skip re-prefilling
+# it, and only the short analysis-bearing user message varies. The schema
+# is a compact single line — the model needs key names, not layout.
+_SYSTEM_PROMPT = (
+    "Based on the AI market analysis provided by the user, generate strategic "
+    "business recommendations. Focus on practical, business-ready actions. "
+    "Respond only with JSON in this exact format: "
+    '{"recommendations": [{"action": "Specific actionable recommendation", '
+    '"rationale": "Why this recommendation makes sense", '
+    '"priority": "High/Medium/Low", "timeline": "Short/Medium/Long term"}], '
+    '"key_considerations": ["consideration1", "consideration2"], '
+    '"risk_mitigation": ["risk1_mitigation", "risk2_mitigation"]}'
+)
+
+# Serialized once at import; matters when an upstream outage pushes every
+# call onto the error path. Compact on purpose: the consumer is a JSON
+# parser (and possibly another LLM), so indentation is wasted bytes/tokens
+_FALLBACK_JSON = fast_json.dumps({
+    "recommendations": [
+        {
+            "action": "Monitor AI technology developments closely",
+            "rationale": "Rapid pace of AI advancement requires continuous awareness",
+            "priority": "High",
+            "timeline": "Short term"
+        }
+    ],
+    "key_considerations": ["Technology adoption costs", "Competitive landscape"],
+    "risk_mitigation": ["Gradual implementation", "Staff training programs"]
+})
+
+
 class DecisionTool(BaseTool):
     """Tool for generating strategic business recommendations."""
     
@@ -18,63 +57,54 @@ class DecisionTool(BaseTool):
         "Returns structured recommendations with rationale and priority."
     )
     
-    def _run(self, analysis: str) -> str:
+    def _run(self, analysis: Union[str, Dict[str, Any]]) -> str:
         """
         Generate strategic recommendations from analysis.
-        
+
         Args:
-            analysis: Analysis results as string or JSON
-            
+            analysis: Analysis results as a dict or JSON string
+
         Returns:
             Structured recommendations as JSON string
         """
         try:
-            llm = LLMFactory.create_reasoning_llm()
-            
-            prompt = f"""
-            Based on the following AI market analysis, generate strategic business recommendations.
-            
-            Analysis Data:
-            {analysis}
-            
-            Provide recommendations in this exact JSON format:
-            {{
-                "recommendations": [
-                    {{
-                        "action": "Specific actionable recommendation",
-                        "rationale": "Why this recommendation makes sense",
-                        "priority": "High/Medium/Low",
-                        "timeline": "Short/Medium/Long term"
-                    }}
-                ],
-                "key_considerations": ["consideration1", "consideration2"],
-                "risk_mitigation": ["risk1_mitigation", "risk2_mitigation"]
-            }}
-            
-            Focus on practical, business-ready actions.
-            """
-            
-            messages = [HumanMessage(content=prompt)]
+            # Stringify once here at the tool boundary; callers pass dicts
+            if not isinstance(analysis, str):
+                analysis = fast_json.dumps(analysis)
+
+            llm = _get_reasoning_llm()
+
+            messages = [
+                SystemMessage(content=_SYSTEM_PROMPT),
+                HumanMessage(content=self._prompt(analysis))
+            ]
             response = llm.invoke(messages)
-            
-            return response.content.strip()
+
+            # No strip: callers parse this via loads_relaxed, which already
+            # tolerates surrounding whitespace, so the copy buys nothing
+            return response.content
             
         except Exception as e:
             # Fallback structured response
-            fallback = {
-                "recommendations": [
-                    {
-                        "action": "Monitor AI technology developments closely",
-                        "rationale": "Rapid pace of AI advancement requires continuous awareness",
-                        "priority": "High",
-                        "timeline": "Short term"
-                    }
-                ],
-                "key_considerations": ["Technology adoption costs", "Competitive landscape"],
-                "risk_mitigation": ["Gradual implementation", "Staff training programs"]
-            }
-            return json.dumps(fallback, indent=2)
+            return _FALLBACK_JSON
     
-    async def _arun(self, analysis: str) -> str:
-        """Async version of the decision tool."""
-        return self._run(analysis)
\ No newline at end of file
+    def _prompt(self, analysis: str) -> str:
+        """Build the variable user message for the given analysis."""
+        return f"Analysis Data: {analysis}"
+
+    async def _arun(self, analysis: Union[str, Dict[str, Any]]) -> str:
+        """Async version of the decision tool (non-blocking)."""
+        try:
+            if not isinstance(analysis, str):
+                analysis = fast_json.dumps(analysis)
+            llm = _get_reasoning_llm()
+            messages = [
+                SystemMessage(content=_SYSTEM_PROMPT),
+                HumanMessage(content=self._prompt(analysis))
+            ]
+            response = await llm.ainvoke(messages)
+            return response.content
+        except Exception:
+            # Fallback structured response; going back through _run would
+            # re-attempt the whole blocking LLM call just to land here
+            return _FALLBACK_JSON
\ No newline at end of file
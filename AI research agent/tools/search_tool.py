@@ -1,11 +1,144 @@
 """
 Search tool for retrieving up-to-date information.
 """
+import asyncio
+import re
 import requests
-from typing import Dict, Any
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List
 from langchain.tools import BaseTool
 from pydantic import Field
-import json
+from core import fast_json
+from core.http_clients import get_async_client
+
+
+# Shared session so repeated searches reuse one pooled TCP+TLS connection
+# instead of paying the handshake (~100-300ms) on every query
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Static portions of the simulated fallback responses, joined once at
+# import; only the query-bearing header line is built per call
+_GENAI_FALLBACK = "\n".join([
+    "Major developments in generative AI and LLMs in 2024:",
+    "• GPT-4 Turbo and Claude-3 showing improved reasoning capabilities",
+    "• Multimodal models integrating text, image, and audio processing",
+    "• Enterprise adoption accelerating with Microsoft Copilot, Google Workspace AI",
+    "• Open-source models like Llama 3.1 achieving competitive performance",
+    "• AI safety research focusing on alignment and constitutional AI",
+    "• Regulatory frameworks emerging: EU AI Act, US Executive Orders",
+    "• Cost reductions making AI accessible to smaller businesses",
+    "• Integration with existing business workflows becoming standard"
+])
+# Single-pass, case-insensitive classification of genAI-flavored queries;
+# no lowercased copies per call and new keywords are a one-line addition
+_GENAI_RE = re.compile(r'generative ai|large language model', re.IGNORECASE)
+
+_GENERIC_FALLBACK = (
+    "Recent AI developments include advances in large language models, "
+    "multimodal AI systems, and enterprise AI adoption. Key trends show "
+    "increased focus on AI safety, regulatory frameworks, and practical "
+    "business applications across industries."
+)
+
+
+# Using DuckDuckGo Instant Answer API (no key required)
+_SEARCH_URL = "https://api.duckduckgo.com/"
+
+
+def _params(query: str) -> Dict[str, str]:
+    """Build the Instant Answer API query parameters."""
+    return {
+        "q": f"{query} AI artificial intelligence",
+        "format": "json",
+        "no_html": "1",
+        "skip_disambig": "1"
+    }
+
+
+def _format_results(query: str, data: Dict[str, Any]) -> str:
+    """Format a parsed Instant Answer payload into result text."""
+    results = []
+
+    # Add abstract if available
+    if data.get("Abstract"):
+        results.append(f"Summary: {data['Abstract']}")
+
+    # Add related topics (limit to 3); one comprehension over the sliced
+    # list, with the header only emitted when something survived the filter
+    texts = [
+        topic["Text"]
+        for topic in data.get("RelatedTopics", ())[:3]
+        if isinstance(topic, dict) and topic.get("Text")
+    ]
+    if texts:
+        results.append("\nRelated Information:")
+        results.extend(f"- {text}" for text in texts)
+
+    # Add answer if available
+    if data.get("Answer"):
+        results.append(f"\nDirect Answer: {data['Answer']}")
+
+    # If no results from DuckDuckGo, provide a comprehensive simulated response
+    if not results:
+        # Provide detailed, realistic AI trends based on the query
+        if _GENAI_RE.search(query):
+            return f"Search Results for '{query}':\n{_GENAI_FALLBACK}"
+        return f"Search Results for '{query}':\n{_GENERIC_FALLBACK}"
+
+    return "\n".join(results)
+
+
+def _error_fallback(query: str) -> str:
+    """Fallback response for demo purposes when the search itself fails."""
+    return (
+        f"Search completed for '{query}'. "
+        f"Current AI landscape shows rapid advancement in generative AI, "
+        f"enterprise adoption, and regulatory developments. "
+        f"Key areas include LLMs, computer vision, and AI safety research."
+    )
+
+
+@lru_cache(maxsize=512)
+def _fetch(query: str) -> str:
+    """
+    Fetch and format DuckDuckGo results for a normalized query.
+
+    Agent workflows repeat sub-queries often; caching at this layer turns
+    the second identical search into a dict lookup instead of a network
+    round-trip. Callers normalize the query so trivially different
+    spellings share one entry.
+
+    Args:
+        query: Normalized (stripped, lowercased) search query
+
+    Returns:
+        Formatted search results as string
+    """
+    response = _SESSION.get(_SEARCH_URL, params=_params(query), timeout=10)
+    response.raise_for_status()
+
+    # Parse raw bytes in one pass (orjson when available) instead of
+    # response.json(), which decodes to str then parses with stdlib json
+    data = fast_json.loads(response.content)
+    return _format_results(query, data)
+
+
+# Small async result cache mirroring the lru_cache on the sync path
+# (lru_cache can't be shared across both)
+_ASYNC_CACHE: Dict[str, str] = {}
+_ASYNC_CACHE_MAX = 512
+
+
+async def _afetch(query: str) -> str:
+    """Async counterpart of _fetch over the process-wide httpx client."""
+    response = await get_async_client().get(
+        _SEARCH_URL, params=_params(query), timeout=10
+    )
+    response.raise_for_status()
+    data = fast_json.loads(response.content)
+    return _format_results(query, data)
 
 
 class SearchTool(BaseTool):
@@ -29,74 +162,43 @@ class SearchTool(BaseTool):
             Formatted search results as string
         """
         try:
-            # Using DuckDuckGo Instant Answer API (no key required)
-            url = "https://api.duckduckgo.com/"
-            params = {
-                "q": f"{query} AI artificial intelligence",
-                "format": "json",
-                "no_html": "1",
-                "skip_disambig": "1"
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Format results
-            results = []
-            
-            # Add abstract if available
-            if data.get("Abstract"):
-                results.append(f"Summary: {data['Abstract']}")
-            
-            # Add related topics
-            if data.get("RelatedTopics"):
-                results.append("\nRelated Information:")
-                for topic in data["RelatedTopics"][:3]:  # Limit to 3 topics
-                    if isinstance(topic, dict) and topic.get("Text"):
-                        results.append(f"- {topic['Text']}")
-            
-            # Add answer if available
-            if data.get("Answer"):
-                results.append(f"\nDirect Answer: {data['Answer']}")
-            
-            # If no results from DuckDuckGo, provide a comprehensive simulated response
-            if not results:
-                # Provide detailed, realistic AI trends based on the query
-                if "generative AI" in query.lower() or "large language model" in query.lower():
-                    results = [
-                        f"Search Results for '{query}':",
-                        "Major developments in generative AI and LLMs in 2024:",
-                        "• GPT-4 Turbo and Claude-3 showing improved reasoning capabilities",
-                        "• Multimodal models integrating text, image, and audio processing",
-                        "• Enterprise adoption accelerating with Microsoft Copilot, Google Workspace AI",
-                        "• Open-source models like Llama 3.1 achieving competitive performance",
-                        "• AI safety research focusing on alignment and constitutional AI",
-                        "• Regulatory frameworks emerging: EU AI Act, US Executive Orders",
-                        "• Cost reductions making AI accessible to smaller businesses",
-                        "• Integration with existing business workflows becoming standard"
-                    ]
-                else:
-                    results = [
-                        f"Search Results for '{query}':",
-                        "Recent AI developments include advances in large language models, "
-                        "multimodal AI systems, and enterprise AI adoption. Key trends show "
-                        "increased focus on AI safety, regulatory frameworks, and practical "
-                        "business applications across industries."
-                    ]
-            
-            return "\n".join(results)
-            
+            return _fetch(query.strip().lower())
+
         except Exception as e:
-            # Fallback response for demo purposes
-            return (
-                f"Search completed for '{query}'. "
-                f"Current AI landscape shows rapid advancement in generative AI, "
-                f"enterprise adoption, and regulatory developments. "
-                f"Key areas include LLMs, computer vision, and AI safety research."
-            )
-    
+            return _error_fallback(query)
+
     async def _arun(self, query: str) -> str:
-        """Async version of the search tool."""
-        return self._run(query)
\ No newline at end of file
+        """Async search; native non-blocking HTTP when httpx is available."""
+        if get_async_client() is None:
+            return await asyncio.to_thread(self._run, query)
+
+        key = query.strip().lower()
+        cached = _ASYNC_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await _afetch(key)
+        except Exception:
+            return _error_fallback(query)
+
+        if len(_ASYNC_CACHE) >= _ASYNC_CACHE_MAX:
+            _ASYNC_CACHE.pop(next(iter(_ASYNC_CACHE)))
+        _ASYNC_CACHE[key] = result
+        return result
+
+    async def _arun_batch(self, queries: List[str]) -> List[str]:
+        """
+        Run several searches concurrently over the shared client.
+
+        Multi-hop research steps issue independent sub-queries; gathering
+        them overlaps the network round-trips so the batch costs roughly
+        one search instead of the sum.
+
+        Args:
+            queries: Search query strings
+
+        Returns:
+            One formatted result per query, in order
+        """
+        return list(await asyncio.gather(*(self._arun(query) for query in queries)))
\ No newline at end of file
@@ -1,10 +1,78 @@
 """
 Summarization tool for condensing long text content.
 """
+import asyncio
+import heapq
+import re
+from collections import Counter
+from functools import lru_cache
 from langchain.tools import BaseTool
 from langchain_core.messages import HumanMessage
 from core.llm_factory import LLMFactory
-from typing import Any
+from typing import Any, List
+
+
+@lru_cache(maxsize=1)
+def _get_fast_llm():
+    """Resolve the shared fast LLM once instead of per tool call."""
+    return LLMFactory.create_fast_llm()
+
+
+# Hoisted so the static prompt skeleton is built once, not per call
+_SUMMARY_PROMPT = """
+            Summarize the following text content into a concise, factual summary.
+            Focus on key facts, trends, and important information.
+            Avoid opinions and speculation.
+            Keep the summary under 200 words.
+
+            Text to summarize:
+            {text}
+
+            Summary:
+            """
+
+# Compiled once for the extractive fallback: sentence boundaries and
+# word tokens, each found in a single scan. The boundary pattern matches
+# core/text_budget.py so newline-delimited bullets (the exact shape
+# SearchTool emits) count as sentences even without periods
+_SENT_RE = re.compile(r'[^.!?\n]+[.!?]?')
+_WORD_RE = re.compile(r'\w+')
+
+
+def _extractive_fallback(text: str) -> str:
+    """
+    Summarize without an LLM when the provider call fails.
+
+    Classic extractive summary: score each sentence by the average corpus
+    frequency of its tokens (one tokenization pass over the text), pick
+    the top three in O(N log 3), and emit them in document order. Short
+    texts pass through unchanged.
+
+    Args:
+        text: Text content to summarize
+
+    Returns:
+        Extractive summary as string
+    """
+    words = text.split()
+    if len(words) <= 100:
+        return text
+
+    frequencies = Counter(_WORD_RE.findall(text.lower()))
+    sentences = [s for s in (m.group().strip() for m in _SENT_RE.finditer(text)) if s]
+    if not sentences:
+        # Nothing splittable; better the full text than an empty summary
+        return text
+
+    def score(sentence: str) -> float:
+        tokens = _WORD_RE.findall(sentence.lower())
+        if not tokens:
+            return 0.0
+        return sum(frequencies[token] for token in tokens) / len(tokens)
+
+    top_sentences = heapq.nlargest(3, sentences, key=score)
+    top_sentences.sort(key=sentences.index)
+    return ' '.join(top_sentences)
 
 
 class SummarizationTool(BaseTool):
@@ -29,36 +97,51 @@ class SummarizationTool(BaseTool):
         """
         try:
             # Use fast LLM for summarization
-            llm = LLMFactory.create_fast_llm()
-            
-            prompt = f"""
-            Summarize the following text content into a concise, factual summary.
-            Focus on key facts, trends, and important information.
-            Avoid opinions and speculation.
-            Keep the summary under 200 words.
-            
-            Text to summarize:
-            {text}
-            
-            Summary:
-            """
-            
-            messages = [HumanMessage(content=prompt)]
+            llm = _get_fast_llm()
+
+            messages = [HumanMessage(content=self._prompt(text))]
             response = llm.invoke(messages)
-            
+
             return response.content.strip()
             
         except Exception as e:
             # Fallback summary
-            words = text.split()
-            if len(words) > 100:
-                # Simple extractive summary - first and key sentences
-                sentences = text.split('.')
-                summary_sentences = sentences[:2] + [s for s in sentences[2:5] if 'AI' in s or 'artificial intelligence' in s.lower()]
-                return '. '.join(summary_sentences[:3]) + '.'
-            else:
-                return text
+            return _extractive_fallback(text)
     
+    def _prompt(self, text: str) -> str:
+        """Build the summarization prompt for the given text."""
+        return _SUMMARY_PROMPT.format(text=text)
+
+    def _run_batch(self, texts: List[str]) -> List[str]:
+        """
+        Summarize several texts in one batched LLM call.
+
+        Batching lets the provider's continuous batching hide per-request
+        overhead, so N summaries cost far less than N serial round-trips.
+
+        Args:
+            texts: Text contents to summarize
+
+        Returns:
+            One summary per input, in order
+        """
+        llm = _get_fast_llm()
+        messages_list = [[HumanMessage(content=self._prompt(text))] for text in texts]
+        responses = llm.batch(messages_list, config={"max_concurrency": 16})
+        return [response.content.strip() for response in responses]
+
+    async def _arun_batch(self, texts: List[str]) -> List[str]:
+        """Async batched summarization via concurrent ainvoke calls."""
+        return list(await asyncio.gather(*(self._arun(text) for text in texts)))
+
     async def _arun(self, text: str) -> str:
-        """Async version of the summarization tool."""
-        return self._run(text)
\ No newline at end of file
+        """Async version of the summarization tool (non-blocking)."""
+        try:
+            llm = _get_fast_llm()
+            messages = [HumanMessage(content=self._prompt(text))]
+            response = await llm.ainvoke(messages)
+            return response.content.strip()
+        except Exception:
+            # Pure-Python fallback; going back through _run would re-attempt
+            # the whole blocking LLM call just to reach the same branch
+            return _extractive_fallback(text)
\ No newline at end of file